@@ -1,26 +1,38 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from api import apiKEY
 import yfinance as yf
 import pandas as pd
 from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from streamlit_option_menu import option_menu
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import precision_score
-from urllib.request import urlopen, Request
-from bs4 import BeautifulSoup
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from prophet import Prophet
 from prophet.plot import plot_plotly
 from plotly import graph_objs as go
-from PIL import Image
 
-favicon = Image.open("./data/favicon.png")
+# Date bounds shared by every price history download in this run
+HISTORY_START = "2010-01-01"
+PROPHET_START = "2015-01-01"
+TODAY = date.today().strftime("%Y-%m-%d")
+
+# Price columns kept from yfinance histories (drops dividends/splits etc.)
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+# Seconds to wait on an external site before giving up
+REQUEST_TIMEOUT = 10
+
+# Ticker symbol for each company in the horizontal menu
+TICKERS = {"Apple": "AAPL", "Google": "GOOGL", "Meta": "META", "Microsoft": "MSFT"}
 
 st.set_page_config(
     page_title="investingIQ - Analyze stocks as easily as buying a coffee.",
-    page_icon=favicon,
+    page_icon="./data/favicon.png",
 )
 
 # 1. as sidebar menu
@@ -43,12 +55,33 @@ stock = option_menu(
     orientation="horizontal"
 )
 
-def show_news(company):
+# Shared across reruns so the TCP/TLS connections to each host are reused
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    session = requests.Session()
+    # Retry rate limits and transient server errors with exponential backoff,
+    # ignoring Retry-After so a server cannot stretch the wait without bound.
+    # Two retries means at most three attempts; REQUEST_TIMEOUT limits each
+    # connect/read, so a stalled host costs about 3 x 10s plus 0+1s of backoff
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  respect_retry_after_header=False)
+    # Every Streamlit session shares this pool, so keep more than the default 10 per host
+    adapter = HTTPAdapter(pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Avoid hitting the NewsAPI quota on every rerun of the Info page
+@st.cache_data(ttl=900, max_entries=16)
+def get_news(company):
     url = f"https://newsapi.org/v2/top-headlines?q={company}&apiKey={apiKEY}"
     
-    r = requests.get(url)
+    r = get_http_session().get(url, timeout=REQUEST_TIMEOUT)
     r = r.json()
-    articles = r['articles']
+    return r['articles']
+
+def show_news(company):
+    articles = get_news(company)
 
     for article in articles:
         st.subheader(article['title'])
@@ -66,7 +99,7 @@ def get_balance_sheet_from_yfinance_web(ticker):
                 AppleWebKit/537.36 (KHTML, like Gecko) Chrome/54.0.2840.99 Safari/537.36'
                 }
         
-    r = requests.get(url, headers=header)
+    r = get_http_session().get(url, headers=header, timeout=REQUEST_TIMEOUT)
     html = r.text
     soup = BeautifulSoup(html, "html.parser")
 
@@ -81,7 +114,8 @@ def get_balance_sheet_from_yfinance_web(ticker):
         if text != "Breakdown":
             col.append( datetime.strptime(text, "%m/%d/%Y") )
     
-    df = pd.DataFrame(columns=col)
+    index = []
+    rows = []
     for div in soup.find_all('div', attrs={'data-test': 'fin-row'}):
         i = 0
         idx = ""
@@ -93,20 +127,31 @@ def get_balance_sheet_from_yfinance_web(ticker):
                 num = int(h.get_text().replace(",", "")) * 1000
                 val.append( num )
             i += 1
-        row = pd.DataFrame([val], columns=col, index=[idx] )
-        df = df.append(row)
+        index.append(idx)
+        rows.append(val)
+
+    # Build the frame once instead of appending (and copying) it per row
+    df = pd.DataFrame(rows, columns=col, index=index)
 
     return df
 
-def sentimental_analysis(stock):
+# Loading the VADER lexicon is slow; build the analyzer once per process
+@st.cache_resource(show_spinner=False)
+def get_vader():
+    return SentimentIntensityAnalyzer()
+
+# Headlines only change a few times an hour, so reuse the scored frame
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def get_news_sentiment(stock):
     finviz_url = 'https://finviz.com/quote.ashx?t='
 
     # Scraping Data
     news_tables = {}
     url = finviz_url + stock
-    req = Request(url=url, headers={'user-agent':'my-app'})
-    response = urlopen(req)
-    html = BeautifulSoup(response, 'html')
+    response = get_http_session().get(url, headers={'user-agent':'my-app'}, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    # Raw bytes let BeautifulSoup honour the page's <meta charset>
+    html = BeautifulSoup(response.content, 'html')
     news_table = html.find(id='news-table')
     news_tables[stock] = news_table
 
@@ -126,39 +171,52 @@ def sentimental_analysis(stock):
     # Sentiment Analysis
     df = pd.DataFrame(parsed_data, columns=['stock', 'date', 'time', 'title'])
 
-    vader = SentimentIntensityAnalyzer()
+    vader = get_vader()
 
-    f = lambda title: vader.polarity_scores(title)['compound']
-    df['compound'] = df['title'].apply(f)
+    df['compound'] = [vader.polarity_scores(title)['compound'] for title in df['title']]
     df['date'] = pd.to_datetime(df.date).dt.date
 
-    mean_df = df.groupby(['stock', 'date']).mean()
-    mean_df = mean_df.unstack()
-    mean_df = mean_df.xs('compound', axis='columns').transpose()
-    st.bar_chart(mean_df)
+    # Average only the score column; one row per date, one column per stock
+    mean_df = df.groupby(['date', 'stock'])['compound'].mean().unstack()
+    return mean_df
+
+# Shared by the Analysis and Random Forest pages; refreshed hourly
+@st.cache_data(ttl=3600, max_entries=16)
+def load_history(ticker):
+    data = yf.Ticker(ticker).history(start=HISTORY_START, end=TODAY)
+    # A cache miss returns this object itself, so hand back an owned frame
+    # that callers (e.g. train_random_forest) can add columns to
+    return data[OHLCV].copy()
+
+@st.cache_data(ttl=3600, max_entries=16)
+def load_data(ticker):
+    data = yf.download(ticker, PROPHET_START, TODAY)
+    data.reset_index(inplace=True)
+    # Prophet needs naive timestamps; strip the zone in one vectorized call
+    if data["Date"].dt.tz is not None:
+        data["Date"] = data["Date"].dt.tz_localize(None)
+    return data
+
+# Fitting is the slow part, and it does not depend on the forecast horizon,
+# so moving the years slider only re-runs predict() on the cached model
+@st.cache_resource(ttl=3600, max_entries=16)
+def fit_prophet(ticker):
+    df_train = load_data(ticker)[['Date','Close']]
+    df_train = df_train.rename(columns={"Date": "ds", "Close": "y"})
 
-def prediction_using_prophet(stock):
-    START = "2015-01-01"
-    TODAY = date.today().strftime("%Y-%m-%d")
+    m = Prophet()
+    m.fit(df_train)
+    return m
 
+def prediction_using_prophet(stock):
     st.subheader('Stock Prediction using FB Prophet')
     selected_stock = stock
 
     n_years = st.slider('Years of prediction:', 1, 4)
     period = n_years * 365
 
-    @st.cache_data
-    def load_data(ticker):
-        data = yf.download(ticker, START, TODAY)
-        data.reset_index(inplace=True)
-        return data
-
-    def remove_timezone(dt):
-        return dt.replace(tzinfo=None)
-        
     data_load_state = st.text("Load data...")
     data = load_data(selected_stock)
-    data["Date"] = data["Date"].apply(remove_timezone)
     data_load_state.text('Loading data, done!')
 
     st.subheader('Raw data')
@@ -175,11 +233,7 @@ def prediction_using_prophet(stock):
     plot_raw_data()
 
     # Predict forecast with Prophet.
-    df_train = data[['Date','Close']]
-    df_train = df_train.rename(columns={"Date": "ds", "Close": "y"})
-
-    m = Prophet()
-    m.fit(df_train)
+    m = fit_prophet(selected_stock)
     future = m.make_future_dataframe(periods=period)
     forecast = m.predict(future)
 
@@ -195,74 +249,70 @@ def prediction_using_prophet(stock):
     fig2 = m.plot_components(forecast)
     st.write(fig2)
 
-def prediction_using_random_forest(stock):
-    start = "2010-01-01"
-    end = date.today().strftime("%Y-%m-%d")
-
-    sp500 = yf.Ticker(stock)
-    sp500 = sp500.history(start=start, end=end)
-
-    del sp500['Dividends']
-    del sp500['Stock Splits']
+def predict(train, test, predictors, model):
+    model.fit(train[predictors], train["Target"])
+    preds = model.predict(test[predictors])
+    preds = pd.Series(preds, index=test.index, name="Predictions")
+    combined = pd.concat([test["Target"], preds], axis=1)
+    return combined
+
+def backtest(data, model, predictors, start=2500, step=250):
+    all_predictions = []
+
+    for i in range(start, data.shape[0], step):
+        train = data.iloc[0:i].copy()
+        test = data.iloc[i:(i+step)].copy()
+        predictions = predict(train, test, predictors, model)
+        all_predictions.append(predictions)
+    
+    return pd.concat(all_predictions)
 
-    sp500["Tomorrow"] = sp500["Close"].shift(-1)
-    sp500["Target"] = (sp500["Tomorrow"] > sp500["Close"]).astype(int)
+# The backtest refits a forest per 250-day step; reuse it across reruns
+@st.cache_data(ttl=3600, max_entries=16)
+def train_random_forest(ticker):
+    df = load_history(ticker)
 
-    st.subheader("Stock Prediction using Random Forest")
+    df["Tomorrow"] = df["Close"].shift(-1)
+    df["Target"] = (df["Tomorrow"] > df["Close"]).astype(int)
 
-    def predict(train, test, predictors, model):
-        model.fit(train[predictors], train["Target"])
-        preds = model.predict(test[predictors])
-        preds = pd.Series(preds, index=test.index, name="Predictions")
-        combined = pd.concat([test["Target"], preds], axis=1)
-        return combined
-
-    def backtest(data, model, predictors, start=2500, step=250):
-        all_predictions = []
-
-        for i in range(start, data.shape[0], step):
-            train = data.iloc[0:i].copy()
-            test = data.iloc[i:(i+step)].copy()
-            predictions = predict(train, test, predictors, model)
-            all_predictions.append(predictions)
-        
-        return pd.concat(all_predictions)
+    # Trees are independent, so grow them on every core
+    model = RandomForestClassifier(n_estimators=100, min_samples_split=100, random_state=1, n_jobs=-1)
 
-    def train_model(df):
-        model = RandomForestClassifier(n_estimators=100, min_samples_split=100, random_state=1)
+    train = df.iloc[:-100]
+    test = df.iloc[-100:]
 
-        train = df.iloc[:-100]
-        test = df.iloc[-100:]
+    predictors = ["Close", "Volume", "Open", "High", "Low"]
+    model.fit(train[predictors], train["Target"])
 
-        predictors = ["Close", "Volume", "Open", "High", "Low"]
-        model.fit(train[predictors], train["Target"])
+    preds = model.predict(test[predictors])
+    preds = pd.Series(preds, index=test.index)
+    # print(precision_score(test["Target"], preds))
 
-        preds = model.predict(test[predictors])
-        preds = pd.Series(preds, index=test.index)
-        # print(precision_score(test["Target"], preds))
+    combined = pd.concat([test["Target"], preds], axis=1)
+    predictions = backtest(df, model, predictors)
+    return combined, predictions
 
-        combined = pd.concat([test["Target"], preds], axis=1)
-        st.line_chart(combined)
+def prediction_using_random_forest(stock):
+    st.subheader("Stock Prediction using Random Forest")
 
-        predictions = backtest(df, model, predictors)
-        st.write("Precision Score: ")
-        st.write(precision_score(predictions["Target"], predictions["Predictions"]))
-        st.write("Predicted Buy Percentage: ")
-        st.write(predictions["Predictions"].value_counts() / predictions.shape[0])
-        # st.write(predictions["Predictions"].value_counts())
-        st.write("Actual Buy Percentage: ")
-        st.write(predictions["Target"].value_counts() / predictions.shape[0])
+    combined, predictions = train_random_forest(stock)
+    st.line_chart(combined)
 
-    train_model(sp500)
+    st.write("Precision Score: ")
+    st.write(precision_score(predictions["Target"], predictions["Predictions"]))
+    st.write("Predicted Buy Percentage: ")
+    st.write(predictions["Predictions"].value_counts() / predictions.shape[0])
+    # st.write(predictions["Predictions"].value_counts())
+    st.write("Actual Buy Percentage: ")
+    st.write(predictions["Target"].value_counts() / predictions.shape[0])
 
 def analyis(stock):
-    start = "2010-01-01"
-    end = date.today().strftime("%Y-%m-%d")
+    # Scrape the news sentiment while the price sections download and render
+    executor = ThreadPoolExecutor(max_workers=1)
+    sentiment = executor.submit(get_news_sentiment, stock)
+    executor.shutdown(wait=False)
 
-    comp = yf.Ticker(stock)
-    data = comp.history(start=start, end=end)
-    del data['Dividends']
-    del data['Stock Splits']
+    data = load_history(stock)
 
     st.subheader("Latest Data: ")
     st.table(data[-10:])
@@ -275,7 +325,28 @@ def analyis(stock):
     # st.table(balance_sheet)
 
     st.subheader("Sentimental Analysis: ")
-    sentimental_analysis(stock)
+    try:
+        mean_df = sentiment.result()
+    except (requests.RequestException, AttributeError) as e:
+        # finviz is blocked, down or changed its layout; keep the price sections
+        st.warning(f"Could not load news sentiment: {e}")
+    else:
+        st.bar_chart(mean_df)
+
+def show_info(company, about, stats, news_query):
+    st.image(f"./data/{company.lower()}_banner.jpg")
+    st.write(f"# {company} Info")
+    c1, c2 = st.columns((2, 1))
+    with c1:
+        st.write(about)
+
+    with c2:
+        st.subheader("2022 Stats: ")
+        for label, value, delta in stats:
+            st.metric(label=label, value=value, delta=delta)
+
+    st.write("# Latest News")
+    show_news(news_query)
 
 textJustify = '''
     <style>
@@ -289,96 +360,57 @@ st.markdown(textJustify, unsafe_allow_html=True)
 
 if selected == "Info":
     if stock == "Apple":
-        st.image("./data/apple_banner.jpg")
-        st.write("# Apple Info")
-        c1, c2 = st.columns((2, 1))
-        with c1:
-            st.write("""Apple is an American technology company founded by Steve Jobs, Steve Wozniak, and Ronald Wayne in April 1976. Incorporated in 1977, the company was one of the early manufacturers of personal computing devices with graphical user interface. Over the years, the company also forayed into other consumer electronics segments like mobile communication devices, digital music players, notebooks, and wearables. The company also develops and markets a range of related software and services, accessories, and networking solutions. Currently, the company’s chief executive officer (CEO) is Timothy Donald Cook, commonly known as Tim Cook.
-            Apple offers consumer technologies of all kinds. Some of its most popular products include the iPhone, iPad, Macbook, and Apple Watch. Apple has 147,000 employees in numerous departments, including retail, software services, hardware, machine learning and AI, support and service, design, and more. Apple also offers services like Apple Music, which launched in June 2015, and Apple TV, which launched in 2019. Apple also provides products and services specifically curated for education, business, health care, and government. As a top member of the Fortune 500, Apple is one of the world’s largest technology companies and its catalogue of offerings continues to grow. Not only is Apple tech savvy, it's business savvy. """)
-        
-        with c2:
-            st.subheader("2022 Stats: ")
-            st.metric(label="Revenue", value="$394.3 billion", delta="2.1")
-            st.metric(label="Operating Income", value="$119.44 billion", delta="1.3")
-            st.metric(label="Net Income", value="$99.80 billion", delta="1.5")
-        
-        st.write("# Latest News")
-        show_news("apple")
-    if stock == "Google":
-        st.image("./data/google_banner.jpg")
-        st.write("# Google Info")
-        c1, c2 = st.columns((2, 1))
-        with c1:
-            st.write("""Alphabet Inc. is an American multinational technology conglomerate holding company headquartered in Mountain View, California. It was created through a restructuring of Google on October 2, 2015, and became the parent company of Google and several former Google subsidiaries. Alphabet is the world's third-largest technology company by revenue and one of the world's most valuable companies. It is one of the Big Five American information technology companies, alongside Amazon, Apple, Meta, and Microsoft.
-            The establishment of Alphabet Inc. was prompted by a desire to make the core Google business "cleaner and more accountable" while allowing greater autonomy to group companies that operate in businesses other than Internet services. Founders Larry Page and Sergey Brin announced their resignation from their executive posts in December 2019, with the CEO role to be filled by Sundar Pichai, also the CEO of Google. Page and Brin remain employees, board members, and controlling shareholders of Alphabet Inc""")
-        
-        with c2:
-            st.subheader("2022 Stats: ")
-            st.metric(label="Revenue", value="$282.8 billion", delta="1.5")
-            st.metric(label="Operating Income", value="$74.84 billion", delta="-1.2")
-            st.metric(label="Net Income", value="$59.97 billion", delta="-1.4")
-        
-        st.write("# Latest News")
-        show_news("Google Company")
-    if stock == "Meta":
-        st.image("./data/meta_banner.jpg")
-        st.write("# Meta Info")
-        c1, c2 = st.columns((2, 1))
-        with c1:
-            st.write("""Meta Platforms, Inc., doing business as Meta and formerly named Facebook, Inc., and TheFacebook, Inc., is an American multinational technology conglomerate based in Menlo Park, California. The company owns Facebook, Instagram, and WhatsApp, among other products and services. Meta was once one of the world's most valuable companies, but as of 2022 is not one of the top twenty biggest companies in the United States. It is considered one of the Big Five American information technology companies, alongside Alphabet (Google), Amazon, Apple, and Microsoft. As of 2022, it is the least profitable of the five.
-            Meta's products and services include Facebook, Messenger, Facebook Watch, and Meta Portal. It has also acquired Oculus, Giphy, Mapillary, Kustomer, Presize and has a 9.99% stake in Jio Platforms. In 2021, the company generated 97.5% of its revenue from the sale of advertising. In October 2021, the parent company of Facebook changed its name from Facebook, Inc., to Meta Platforms, Inc., to "reflect its focus on building the metaverse". According to Meta, the "metaverse" refers to the integrated environment that links all of the company's products and services""")
-        
-        with c2:
-            st.subheader("2022 Stats: ")
-            st.metric(label="Revenue", value="$116.81 billion", delta="-3.5")
-            st.metric(label="Operating Income", value="$28.94 billion", delta="-2.2")
-            st.metric(label="Net Income", value="$23.20 billion", delta="-2.4")
-        
-        st.write("# Latest News")
-        show_news("facebook")
-    if stock == "Microsoft":
-        st.image("./data/microsoft_banner.jpg")
-        st.write("# Microsoft Info")
-        c1, c2 = st.columns((2, 1))
-        with c1:
-            st.write("""Microsoft Corporation is an American multinational technology corporation producing computer software, consumer electronics, personal computers, and related services. Headquartered at the Microsoft campus in Redmond, Washington, Microsoft's best-known software products are the Windows line of operating systems, the Microsoft Office suite, and the Internet Explorer and Edge web browsers. Its flagship hardware products are the Xbox video game consoles and the Microsoft Surface lineup of touchscreen personal computers. Microsoft ranked No. 21 in the 2020 Fortune 500 rankings of the largest United States corporations by total revenue; it was the world's largest software maker by revenue as of 2019. It is one of the Big Five American information technology companies, alongside Alphabet (Google), Amazon, Apple, and Meta.
-            Microsoft Corporation, leading developer of personal-computer software systems and applications. The company also publishes books and multimedia titles, produces its own line of hybrid tablet computers, offers e-mail services, and sells electronic game systems and computer peripherals (input/output devices). It has sales offices throughout the world. In addition to its main research and development centre at its corporate headquarters in Redmond, Washington, U.S., Microsoft operates research labs in Cambridge, England (1997); Beijing, China (1998); Bengaluru, India (2005); Cambridge, Massachusetts (2008); New York, New York (2012); and Montreal, Canada (2015).""")
-        
-        with c2:
-            st.subheader("2022 Stats: ")
-            st.metric(label="Revenue", value="$198.3 billion", delta="2.8")
-            st.metric(label="Operating Income", value="$83.4 billion", delta="2.5")
-            st.metric(label="Net Income", value="$72.7 billion", delta="2.4")
-        
-        st.write("# Latest News")
-        show_news("microsoft")
-if selected == "Analysis":
-    if stock == "Apple":
-        st.write("# Apple Stock Analysis")
-        analyis("AAPL")
-    if stock == "Google":
-        st.write("# Google Stock Analysis")
-        analyis("GOOGL")
-    if stock == "Meta":
-        st.write("# Meta Stock Analysis")
-        analyis("META")
-    if stock == "Microsoft":
-        st.write("# Microsoft Stock Analysis")
-        analyis("MSFT")
-if selected == "Predictions":
-    if stock == "Apple":
-        st.write("# Apple Stock Predictions")
-        prediction_using_prophet("AAPL")
-        prediction_using_random_forest("AAPL")
-    if stock == "Google":
-        st.write("# Google Stock Predictions")
-        prediction_using_prophet("GOOGL")
-        prediction_using_random_forest("GOOGL")
-    if stock == "Meta":
-        st.write("# Meta Stock Predictions")
-        prediction_using_prophet("META")
-        prediction_using_random_forest("META")
-    if stock == "Microsoft":
-        st.write("# Microsoft Stock Predictions")
-        prediction_using_prophet("MSFT")
-        prediction_using_random_forest("MSFT")
\ No newline at end of file
+        show_info(
+            "Apple",
+            """Apple is an American technology company founded by Steve Jobs, Steve Wozniak, and Ronald Wayne in April 1976. Incorporated in 1977, the company was one of the early manufacturers of personal computing devices with graphical user interface. Over the years, the company also forayed into other consumer electronics segments like mobile communication devices, digital music players, notebooks, and wearables. The company also develops and markets a range of related software and services, accessories, and networking solutions. Currently, the company’s chief executive officer (CEO) is Timothy Donald Cook, commonly known as Tim Cook.
+            Apple offers consumer technologies of all kinds. Some of its most popular products include the iPhone, iPad, Macbook, and Apple Watch. Apple has 147,000 employees in numerous departments, including retail, software services, hardware, machine learning and AI, support and service, design, and more. Apple also offers services like Apple Music, which launched in June 2015, and Apple TV, which launched in 2019. Apple also provides products and services specifically curated for education, business, health care, and government. As a top member of the Fortune 500, Apple is one of the world’s largest technology companies and its catalogue of offerings continues to grow. Not only is Apple tech savvy, it's business savvy. """,
+            [
+                ("Revenue", "$394.3 billion", "2.1"),
+                ("Operating Income", "$119.44 billion", "1.3"),
+                ("Net Income", "$99.80 billion", "1.5"),
+            ],
+            "apple",
+        )
+    elif stock == "Google":
+        show_info(
+            "Google",
+            """Alphabet Inc. is an American multinational technology conglomerate holding company headquartered in Mountain View, California. It was created through a restructuring of Google on October 2, 2015, and became the parent company of Google and several former Google subsidiaries. Alphabet is the world's third-largest technology company by revenue and one of the world's most valuable companies. It is one of the Big Five American information technology companies, alongside Amazon, Apple, Meta, and Microsoft.
+            The establishment of Alphabet Inc. was prompted by a desire to make the core Google business "cleaner and more accountable" while allowing greater autonomy to group companies that operate in businesses other than Internet services. Founders Larry Page and Sergey Brin announced their resignation from their executive posts in December 2019, with the CEO role to be filled by Sundar Pichai, also the CEO of Google. Page and Brin remain employees, board members, and controlling shareholders of Alphabet Inc""",
+            [
+                ("Revenue", "$282.8 billion", "1.5"),
+                ("Operating Income", "$74.84 billion", "-1.2"),
+                ("Net Income", "$59.97 billion", "-1.4"),
+            ],
+            "Google Company",
+        )
+    elif stock == "Meta":
+        show_info(
+            "Meta",
+            """Meta Platforms, Inc., doing business as Meta and formerly named Facebook, Inc., and TheFacebook, Inc., is an American multinational technology conglomerate based in Menlo Park, California. The company owns Facebook, Instagram, and WhatsApp, among other products and services. Meta was once one of the world's most valuable companies, but as of 2022 is not one of the top twenty biggest companies in the United States. It is considered one of the Big Five American information technology companies, alongside Alphabet (Google), Amazon, Apple, and Microsoft. As of 2022, it is the least profitable of the five.
+            Meta's products and services include Facebook, Messenger, Facebook Watch, and Meta Portal. It has also acquired Oculus, Giphy, Mapillary, Kustomer, Presize and has a 9.99% stake in Jio Platforms. In 2021, the company generated 97.5% of its revenue from the sale of advertising. In October 2021, the parent company of Facebook changed its name from Facebook, Inc., to Meta Platforms, Inc., to "reflect its focus on building the metaverse". According to Meta, the "metaverse" refers to the integrated environment that links all of the company's products and services""",
+            [
+                ("Revenue", "$116.81 billion", "-3.5"),
+                ("Operating Income", "$28.94 billion", "-2.2"),
+                ("Net Income", "$23.20 billion", "-2.4"),
+            ],
+            "facebook",
+        )
+    elif stock == "Microsoft":
+        show_info(
+            "Microsoft",
+            """Microsoft Corporation is an American multinational technology corporation producing computer software, consumer electronics, personal computers, and related services. Headquartered at the Microsoft campus in Redmond, Washington, Microsoft's best-known software products are the Windows line of operating systems, the Microsoft Office suite, and the Internet Explorer and Edge web browsers. Its flagship hardware products are the Xbox video game consoles and the Microsoft Surface lineup of touchscreen personal computers. Microsoft ranked No. 21 in the 2020 Fortune 500 rankings of the largest United States corporations by total revenue; it was the world's largest software maker by revenue as of 2019. It is one of the Big Five American information technology companies, alongside Alphabet (Google), Amazon, Apple, and Meta.
+            Microsoft Corporation, leading developer of personal-computer software systems and applications. The company also publishes books and multimedia titles, produces its own line of hybrid tablet computers, offers e-mail services, and sells electronic game systems and computer peripherals (input/output devices). It has sales offices throughout the world. In addition to its main research and development centre at its corporate headquarters in Redmond, Washington, U.S., Microsoft operates research labs in Cambridge, England (1997); Beijing, China (1998); Bengaluru, India (2005); Cambridge, Massachusetts (2008); New York, New York (2012); and Montreal, Canada (2015).""",
+            [
+                ("Revenue", "$198.3 billion", "2.8"),
+                ("Operating Income", "$83.4 billion", "2.5"),
+                ("Net Income", "$72.7 billion", "2.4"),
+            ],
+            "microsoft",
+        )
+elif selected == "Analysis":
+    st.write(f"# {stock} Stock Analysis")
+    analyis(TICKERS[stock])
+elif selected == "Predictions":
+    st.write(f"# {stock} Stock Predictions")
+    prediction_using_prophet(TICKERS[stock])
+    prediction_using_random_forest(TICKERS[stock])
\ No newline at end of file